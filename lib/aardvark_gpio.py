@@ -30,11 +30,18 @@ Usage:
     gpio.set_low()   # Set GPIO to LOW (0V)
     gpio.set_high()  # Set GPIO to HIGH (3.3V/5V)
     gpio.close()
+    
+    # Drive several pins together (one USB transaction per update)
+    bank = AardvarkGPIO.open_bank(port=0, pins=['SCL', 'SDA'])
+    bank.set_pins(bank.pin_mask, AardvarkGPIO.GPIO_PINS['SCL'])  # SCL HIGH, SDA LOW
+    bank.close()
 """
 
 import sys
 import time
-from typing import Optional
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
 
 try:
     import aardvark_py as aa
@@ -45,6 +52,69 @@ except ImportError:
     sys.exit(1)
 
 
+class _PortState:
+    """Adapter handle and GPIO registers shared by all instances on one port"""
+    
+    __slots__ = ('handle', 'refcount', 'direction', 'out_state', 'batching', 'dirty')
+    
+    def __init__(self, handle: int):
+        self.handle = handle
+        self.refcount = 1
+        self.direction = 0x00  # Pins configured as outputs
+        self.out_state = 0x00  # Last value written with aa_gpio_set
+        self.batching = False  # Writes deferred by AardvarkGPIO.batch()
+        self.dirty = False     # out_state changed since the batch started
+
+
+# Open adapters keyed by port, so several pin controllers share one handle
+_HANDLE_CACHE: Dict[int, _PortState] = {}
+
+# Last aa_find_devices_ext() result: (timestamp, (num_devices, ports, unique_ids))
+_DEVICES_CACHE: Optional[Tuple[float, tuple]] = None
+_DEVICES_CACHE_TTL = 2.0  # seconds
+
+# Preformatted hex/binary strings for GPIO register values used in log output
+_HEX_TABLE = tuple(f"{i:02X}" for i in range(256))
+_BIN_TABLE = tuple(f"{i:08b}" for i in range(256))
+
+
+def _hex(value: int) -> str:
+    """Format a register readback as 0xNN, keeping aa_* error codes visible"""
+    if 0 <= value <= 0xFF:
+        return "0x" + _HEX_TABLE[value]
+    return "error %d" % value
+
+
+def _release_port(port: int, port_state: _PortState) -> bool:
+    """Drop one reference to a shared adapter, closing it with the last one
+    
+    Returns:
+        True if the adapter was closed
+    """
+    port_state.refcount -= 1
+    if port_state.refcount > 0:
+        return False
+    if _HANDLE_CACHE.get(port) is port_state:
+        del _HANDLE_CACHE[port]
+    aa.aa_close(port_state.handle)
+    return True
+
+
+def _find_devices():
+    """Enumerate Aardvark adapters, reusing a recent result
+    
+    Lets a caller retry after a failed aa_open without re-scanning USB.
+    Empty results are not cached so a newly plugged adapter is seen at once.
+    """
+    global _DEVICES_CACHE
+    now = time.monotonic()
+    if _DEVICES_CACHE is not None and now - _DEVICES_CACHE[0] <= _DEVICES_CACHE_TTL:
+        return _DEVICES_CACHE[1]
+    devices = aa.aa_find_devices_ext(16, 16)
+    _DEVICES_CACHE = (now, devices) if devices[0] > 0 else None
+    return devices
+
+
 class AardvarkGPIO:
     """Aardvark GPIO Controller
     
@@ -61,72 +131,159 @@ class AardvarkGPIO:
         'SS': aa.AA_GPIO_SS,     # Pin 5
     }
     
-    def __init__(self, port: int = 0, pin: int = 0, verbose: bool = True):
+    # (name, mask) by pin number, and pin number by name
+    _PIN_TABLE = tuple(GPIO_PINS.items())
+    _NAME_TO_IDX = {name: idx for idx, (name, _) in enumerate(_PIN_TABLE)}
+    
+    # GPIO register access, bound once to skip the module attribute lookups
+    _aa_set = staticmethod(aa.aa_gpio_set)
+    _aa_get = staticmethod(aa.aa_gpio_get)
+    
+    def __init__(self, port: int = 0, pin=0, verbose: bool = True,
+                 skip_enumeration: bool = False):
         """Initialize Aardvark GPIO controller
         
         Args:
             port: Aardvark adapter port number (0 for first device)
-            pin: GPIO pin number (0-5) or pin name ('SCL', 'SDA', etc.)
+            pin: GPIO pin number (0-5) or pin name ('SCL', 'SDA', etc.),
+                 or a list/tuple of them to drive several pins as one bank
             verbose: Enable verbose output
+            skip_enumeration: Open the port directly without listing devices
+                              first (aa_open fails cleanly on a bad port)
         """
         self.port = port
         self.verbose = verbose
+        self.skip_enumeration = skip_enumeration
         self.handle = None
+        self._port = None
+        self._finalizer = None
+        
+        if isinstance(pin, (list, tuple)):
+            if not pin:
+                raise ValueError("At least one GPIO pin is required")
+            resolved = [self._PIN_TABLE[self._resolve_pin(p)] for p in pin]
+            self.pin_name = '+'.join(name for name, _ in resolved)
+            self.pin_mask = 0
+            for _, mask in resolved:
+                self.pin_mask |= mask
+            self.pin_num = None
+        else:
+            self.pin_num = self._resolve_pin(pin)
+            self.pin_name, self.pin_mask = self._PIN_TABLE[self.pin_num]
+        
+        # Open Aardvark adapter
+        self._open()
+    
+    @classmethod
+    def open_bank(cls, port: int = 0, pins=(0,), verbose: bool = True,
+                  skip_enumeration: bool = False):
+        """Open a controller driving several GPIO pins together
         
-        # Convert pin number to mask
+        Args:
+            port: Aardvark adapter port number (0 for first device)
+            pins: Iterable of GPIO pin numbers (0-5) or pin names, or a
+                  single pin number/name
+            verbose: Enable verbose output
+            skip_enumeration: Open the port directly without listing devices first
+        
+        Returns:
+            AardvarkGPIO instance whose pin_mask covers all requested pins
+        """
+        if isinstance(pins, (int, str)):
+            pins = (pins,)
+        return cls(port=port, pin=tuple(pins), verbose=verbose,
+                   skip_enumeration=skip_enumeration)
+    
+    @classmethod
+    def invalidate_enumeration(cls):
+        """Forget cached device enumeration so the next open re-scans USB"""
+        global _DEVICES_CACHE
+        _DEVICES_CACHE = None
+    
+    @classmethod
+    def _resolve_pin(cls, pin):
+        """Convert a pin number or name to its index in _PIN_TABLE"""
         if isinstance(pin, int):
             if pin < 0 or pin > 5:
                 raise ValueError(f"Invalid GPIO pin: {pin}. Must be 0-5")
-            pin_names = list(self.GPIO_PINS.keys())
-            self.pin_name = pin_names[pin]
-            self.pin_mask = self.GPIO_PINS[self.pin_name]
+            return pin
         elif isinstance(pin, str):
-            pin_upper = pin.upper()
-            if pin_upper not in self.GPIO_PINS:
-                raise ValueError(f"Invalid GPIO pin name: {pin}. Must be one of {list(self.GPIO_PINS.keys())}")
-            self.pin_name = pin_upper
-            self.pin_mask = self.GPIO_PINS[pin_upper]
+            idx = cls._NAME_TO_IDX.get(pin.upper())
+            if idx is None:
+                raise ValueError(f"Invalid GPIO pin name: {pin}. Must be one of {list(cls.GPIO_PINS.keys())}")
+            return idx
         else:
             raise TypeError("pin must be int (0-5) or str (pin name)")
-        
-        self.pin_num = list(self.GPIO_PINS.keys()).index(self.pin_name)
-        
-        # Open Aardvark adapter
-        self._open()
     
-    def _log(self, message: str):
-        """Print log message if verbose is enabled"""
+    def _log(self, fmt: str, *args):
+        """Print log message if verbose is enabled
+        
+        Arguments are %-formatted into fmt only when verbose is on, so quiet
+        callers don't pay for string formatting.
+        """
         if self.verbose:
-            print(f"[AARDVARK] {message}")
+            print("[AARDVARK] " + (fmt % args if args else fmt))
+    
+    @property
+    def _out_state(self) -> int:
+        """Output register shadow, shared with other instances on the same port"""
+        return self._port.out_state
+    
+    @_out_state.setter
+    def _out_state(self, value: int):
+        self._port.out_state = value
     
     def _open(self):
         """Open connection to Aardvark adapter"""
-        # Find all connected Aardvark devices
-        (num_devices, ports, unique_ids) = aa.aa_find_devices_ext(16, 16)
-        
-        if num_devices == 0:
-            raise RuntimeError("No Aardvark adapters found. Check USB connection.")
+        # Reuse an adapter already opened by another instance in this process
+        port_state = _HANDLE_CACHE.get(self.port)
+        if port_state is not None:
+            port_state.refcount += 1
+            self._port = port_state
+            self.handle = port_state.handle
+            self._finalizer = weakref.finalize(self, _release_port, self.port, port_state)
+            self._log("Reusing Aardvark adapter on port %d (handle: %d)", self.port, self.handle)
+            self._configure_gpio()
+            return
         
-        self._log(f"Found {num_devices} Aardvark device(s)")
-        
-        if self.port >= num_devices:
-            raise ValueError(f"Port {self.port} not available. Found {num_devices} device(s)")
+        if not self.skip_enumeration:
+            # Find all connected Aardvark devices
+            (num_devices, ports, unique_ids) = _find_devices()
+            
+            if num_devices == 0:
+                raise RuntimeError("No Aardvark adapters found. Check USB connection.")
+            
+            self._log("Found %d Aardvark device(s)", num_devices)
+            
+            if self.port >= num_devices:
+                raise ValueError(f"Port {self.port} not available. Found {num_devices} device(s)")
         
         # Open the specified port
         self.handle = aa.aa_open(self.port)
         
         if self.handle <= 0:
+            if self.skip_enumeration:
+                raise RuntimeError(f"No Aardvark adapter available on port {self.port}. "
+                                   f"Check USB connection. Error code: {self.handle}")
             raise RuntimeError(f"Failed to open Aardvark on port {self.port}. Error code: {self.handle}")
         
-        self._log(f"Opened Aardvark adapter on port {self.port} (handle: {self.handle})")
+        self._port = _HANDLE_CACHE[self.port] = _PortState(self.handle)
+        # Safety net if close() is never called; runs at most once
+        self._finalizer = weakref.finalize(self, _release_port, self.port, self._port)
+        self._log("Opened Aardvark adapter on port %d (handle: %d)", self.port, self.handle)
         
-        # Get version info
-        version = aa.aa_version(self.handle)
-        self._log(f"API version: {version[0]}, Firmware: {version[1]}")
+        # Get version info (only needed for the log, skip the USB query when quiet)
+        if self.verbose:
+            version = aa.aa_version(self.handle)
+            self._log("API version: %s, Firmware: %s", version[0], version[1])
         
         # IMPORTANT: Configure Aardvark to disable I2C/SPI modes
         # This allows us to use the pins as GPIO
         # AA_CONFIG_GPIO_ONLY = 0x00 means GPIO mode (no I2C/SPI)
+        # Only done on a fresh open; instances sharing a cached handle skip it.
+        # Not gated on AA_CONFIG_QUERY: the query is a USB round-trip of its
+        # own, and another process may have changed the mode since we last
+        # had the port open, so the set form is always sent here.
         aa.aa_configure(self.handle, aa.AA_CONFIG_GPIO_ONLY)
         self._log("Configured Aardvark to GPIO-only mode (I2C/SPI disabled)")
         
@@ -138,47 +295,152 @@ class AardvarkGPIO:
         """Configure GPIO pin as output"""
         # Set pin as output by setting the corresponding bit in the direction register
         # aa_gpio_direction sets pins as outputs (1) or inputs (0)
-        aa.aa_gpio_direction(self.handle, self.pin_mask)
+        # Keep pins already claimed by other instances on this port as outputs
+        self._port.direction |= self.pin_mask
+        aa.aa_gpio_direction(self.handle, self._port.direction)
         
         # Enable GPIO (disable I2C/SPI on these pins if needed)
         # aa_gpio_pullup enables internal pullup resistors
-        aa.aa_gpio_pullup(self.handle, 0x00)  # Disable pullups for cleaner output
+        # Pullups are port-wide, so only the first instance on a port sets them
+        if self._port.refcount == 1:
+            aa.aa_gpio_pullup(self.handle, 0x00)  # Disable pullups for cleaner output
         
         # Initialize to LOW at startup
-        current = aa.aa_gpio_get(self.handle)
-        new_value = current & ~self.pin_mask  # Clear bit = physical GPIO LOW
-        aa.aa_gpio_set(self.handle, new_value)
+        # The output register is shadowed in _out_state (0x00 on a freshly opened
+        # port), so no readback is needed to preserve the other output bits
+        self._out_state &= ~self.pin_mask  # Clear bit = physical GPIO LOW
+        self._aa_set(self.handle, self._out_state)
         
-        self._log(f"Configured GPIO pin {self.pin_name} (pin {self.pin_num}) as output")
-        self._log(f"Initialized GPIO to LOW (0V)")
+        if self.pin_num is None:
+            self._log("Configured GPIO pins %s (mask 0x%s) as outputs", self.pin_name, _HEX_TABLE[self.pin_mask])
+        else:
+            self._log("Configured GPIO pin %s (pin %d) as output", self.pin_name, self.pin_num)
+        self._log("Initialized GPIO to LOW (0V)")
     
-    def set_high(self):
+    def set_pins(self, pin_mask: int, pin_values: int):
+        """Set several output pins in a single USB transaction
+        
+        Args:
+            pin_mask: Bit mask of the pins to change (must be configured outputs)
+            pin_values: New values for those pins; bits outside pin_mask are ignored
+        """
+        if pin_mask & ~self.pin_mask:
+            raise ValueError(f"Pin mask 0x{pin_mask:02X} includes pins not configured as outputs (0x{self.pin_mask:02X})")
+        port_state = self._port
+        port_state.out_state = (port_state.out_state & ~pin_mask) | (pin_values & pin_mask)
+        if port_state.batching:
+            port_state.dirty = True
+        else:
+            self._aa_set(self.handle, port_state.out_state)
+    
+    @contextmanager
+    def batch(self):
+        """Defer GPIO writes and flush them in one USB transaction on exit
+        
+        Usage:
+            with gpio.batch():
+                gpio.set_pins(mask_a, mask_a)
+                gpio.set_pins(mask_b, 0)
+        
+        Only the final output state is written, so pulse() and pulse_train()
+        raise RuntimeError inside a batch.
+        
+        Batching applies to the whole port: writes from other instances
+        sharing this adapter are deferred too until the batch exits.
+        """
+        port_state = self._port
+        if port_state.batching:
+            yield self
+            return
+        port_state.batching = True
+        try:
+            yield self
+        finally:
+            port_state.batching = False
+            if port_state.dirty:
+                port_state.dirty = False
+                self._aa_set(self.handle, port_state.out_state)
+    
+    def get_pins(self) -> int:
+        """Read the current state of this controller's pins
+        
+        Returns:
+            GPIO value masked to pin_mask (set bit = HIGH)
+        """
+        return self.read_port() & self.pin_mask
+    
+    def read_port(self) -> int:
+        """Read all 6 GPIO pins in one USB transaction
+        
+        Returns:
+            Raw GPIO value (bit set = HIGH), see GPIO_PINS for bit masks
+        
+        Raises:
+            RuntimeError: If the adapter returns an error code
+        """
+        value = self._aa_get(self.handle)
+        if value < 0:
+            raise RuntimeError(f"Failed to read Aardvark GPIO on port {self.port}. Error code: {value}")
+        return value & 0x3F
+    
+    def write_port(self, value: int):
+        """Write all 6 GPIO output bits in one USB transaction
+        
+        Bypasses the per-pin mask: every pin configured as an output on this
+        port takes its bit from value. Bits for input pins are ignored.
+        
+        Args:
+            value: Raw GPIO value (bit set = HIGH), see GPIO_PINS for bit masks
+        """
+        self._out_state = value & 0x3F
+        if self._port.batching:
+            self._port.dirty = True
+        else:
+            self._aa_set(self.handle, self._out_state)
+    
+    def set_high(self, force_write: bool = False):
         """Set GPIO pin HIGH (outputs high voltage ~3.3V/5V)
         
         Sets the physical GPIO pin to HIGH state.
         The actual effect on your circuit depends on how it's wired.
+        
+        Args:
+            force_write: Write even if the pin is already HIGH in the cached
+                         output state (otherwise the USB write is skipped)
         """
-        current = aa.aa_gpio_get(self.handle)
-        new_value = current | self.pin_mask  # Set bit = physical HIGH
-        aa.aa_gpio_set(self.handle, new_value)
-        # Verify by reading back
-        actual = aa.aa_gpio_get(self.handle)
-        self._log(f"GPIO pin {self.pin_name} set HIGH")
-        self._log(f"  Physical GPIO: HIGH, Before: 0x{current:02X}, After: 0x{actual:02X}, Pin mask: 0x{self.pin_mask:02X}")
-    
-    def set_low(self):
+        current = self._out_state
+        if not force_write and (current & self.pin_mask) == self.pin_mask:
+            self._log("GPIO pin %s already HIGH, write skipped (cached: 0x%s, Pin mask: 0x%s)",
+                      self.pin_name, _HEX_TABLE[current], _HEX_TABLE[self.pin_mask])
+            return
+        self.set_pins(self.pin_mask, self.pin_mask)  # Set bit = physical HIGH
+        if self.verbose:
+            # Verify by reading back (nothing to read yet while batching)
+            actual = self._port.out_state if self._port.batching else self._aa_get(self.handle)
+            self._log("GPIO pin %s set HIGH (Before: 0x%s, After: %s, Pin mask: 0x%s)",
+                      self.pin_name, _HEX_TABLE[current], _hex(actual), _HEX_TABLE[self.pin_mask])
+    
+    def set_low(self, force_write: bool = False):
         """Set GPIO pin LOW (outputs low voltage ~0V)
         
         Sets the physical GPIO pin to LOW state.
         The actual effect on your circuit depends on how it's wired.
+        
+        Args:
+            force_write: Write even if the pin is already LOW in the cached
+                         output state (otherwise the USB write is skipped)
         """
-        current = aa.aa_gpio_get(self.handle)
-        new_value = current & ~self.pin_mask  # Clear bit = physical LOW
-        aa.aa_gpio_set(self.handle, new_value)
-        # Verify by reading back
-        actual = aa.aa_gpio_get(self.handle)
-        self._log(f"GPIO pin {self.pin_name} set LOW")
-        self._log(f"  Physical GPIO: LOW, Before: 0x{current:02X}, After: 0x{actual:02X}, Pin mask: 0x{self.pin_mask:02X}")
+        current = self._out_state
+        if not force_write and (current & self.pin_mask) == 0:
+            self._log("GPIO pin %s already LOW, write skipped (cached: 0x%s, Pin mask: 0x%s)",
+                      self.pin_name, _HEX_TABLE[current], _HEX_TABLE[self.pin_mask])
+            return
+        self.set_pins(self.pin_mask, 0)  # Clear bit = physical LOW
+        if self.verbose:
+            # Verify by reading back (nothing to read yet while batching)
+            actual = self._port.out_state if self._port.batching else self._aa_get(self.handle)
+            self._log("GPIO pin %s set LOW (Before: 0x%s, After: %s, Pin mask: 0x%s)",
+                      self.pin_name, _HEX_TABLE[current], _hex(actual), _HEX_TABLE[self.pin_mask])
     
     def get_state(self) -> bool:
         """Get current GPIO pin state
@@ -186,30 +448,124 @@ class AardvarkGPIO:
         Returns:
             True if HIGH, False if LOW
         """
-        value = aa.aa_gpio_get(self.handle)
+        value = self.read_port()
         is_high = (value & self.pin_mask) != 0
         if self.verbose:
-            self._log(f"GPIO readback: 0x{value:02X} (binary: {value:08b})")
-            self._log(f"Pin {self.pin_name} (mask 0x{self.pin_mask:02X}): {'HIGH' if is_high else 'LOW'}")
+            self._log("GPIO readback: 0x%s (binary: %s)", _HEX_TABLE[value], _BIN_TABLE[value])
+            self._log("Pin %s (mask 0x%s): %s", self.pin_name, _HEX_TABLE[self.pin_mask], 'HIGH' if is_high else 'LOW')
         return is_high
     
-    def pulse(self, duration_ms: int = 100):
+    @staticmethod
+    def _precise_sleep(seconds: float, yield_gil: bool = False):
+        """Sleep until a perf_counter deadline with sub-millisecond accuracy
+        
+        time.sleep() alone has ~1ms granularity on Linux and can oversleep
+        when preempted, so the bulk of the delay is slept and the last
+        ~1.5ms is busy-waited.
+        
+        Args:
+            seconds: Delay in seconds
+            yield_gil: Call time.sleep(0) in the busy-wait loop so other
+                       Python threads can run (slightly more jitter)
+        """
+        deadline = time.perf_counter() + seconds
+        if seconds > 0.002:
+            time.sleep(seconds - 0.0015)
+        while time.perf_counter() < deadline:
+            if yield_gil:
+                time.sleep(0)
+    
+    def pulse(self, duration_ms: int = 100, yield_gil: bool = False):
         """Generate a pulse (LOW -> HIGH -> LOW)
         
         Args:
             duration_ms: Pulse duration in milliseconds
+            yield_gil: Release the GIL while busy-waiting the pulse tail
         """
+        if self._port.batching:
+            raise RuntimeError("pulse() cannot be used inside batch()")
         self.set_low()
-        time.sleep(duration_ms / 1000.0)
+        self._precise_sleep(duration_ms / 1000.0, yield_gil)
         self.set_high()
-        self._log(f"Generated {duration_ms}ms pulse")
+        self._log("Generated %sms pulse", duration_ms)
+    
+    def pulse_train(self, cycles: int, period_s: float, duty: float = 0.5):
+        """Generate a train of pulses (HIGH -> LOW per cycle)
+        
+        Edges are timed against a running perf_counter deadline and the
+        output values are precomputed, so there is no per-edge logging or
+        bookkeeping. The pins are left LOW afterwards (untouched if cycles
+        is 0).
+        
+        A duty of 0.0 or 1.0 has no edges: the pins are held LOW or HIGH
+        (and left that way) for cycles * period_s.
+        
+        Args:
+            cycles: Number of HIGH/LOW cycles
+            period_s: Cycle period in seconds
+            duty: Fraction of each period spent HIGH (0.0 - 1.0)
+        """
+        if cycles < 0:
+            raise ValueError(f"Invalid cycle count: {cycles}")
+        if period_s <= 0:
+            raise ValueError(f"Invalid period: {period_s}. Must be > 0")
+        if not 0.0 <= duty <= 1.0:
+            raise ValueError(f"Invalid duty cycle: {duty}. Must be 0.0-1.0")
+        if self._port.batching:
+            raise RuntimeError("pulse_train() cannot be used inside batch()")
+        if cycles == 0:
+            return
+        
+        high_val = self._out_state | self.pin_mask
+        low_val = self._out_state & ~self.pin_mask
+        high_dur = period_s * duty
+        low_dur = period_s - high_dur
+        gpio_set = self._aa_set
+        handle = self.handle
+        perf = time.perf_counter
+        
+        if duty == 0.0 or duty == 1.0:
+            level = high_val if duty else low_val
+            gpio_set(handle, level)
+            self._out_state = level
+            self._precise_sleep(cycles * period_s)
+            self._log("Held pin %s %s for %d period(s) of %ss", self.pin_name,
+                      'HIGH' if duty else 'LOW', cycles, period_s)
+            return
+        
+        # Keep the shadow in step with the last write even if interrupted
+        last_val = self._out_state
+        try:
+            t = perf()
+            for _ in range(cycles):
+                gpio_set(handle, high_val)
+                last_val = high_val
+                t += high_dur
+                while perf() < t:
+                    pass
+                gpio_set(handle, low_val)
+                last_val = low_val
+                t += low_dur
+                while perf() < t:
+                    pass
+        finally:
+            self._out_state = last_val
+        
+        self._log("Generated %d pulse(s), period %ss, duty %s", cycles, period_s, duty)
     
     def close(self):
         """Close connection to Aardvark adapter"""
-        if self.handle:
-            aa.aa_close(self.handle)
-            self._log(f"Closed Aardvark adapter")
-            self.handle = None
+        handle = self.handle
+        if handle is None or handle <= 0:
+            return
+        # Clear first so a re-entrant close() during release is a no-op
+        self.handle = None
+        closed = self._finalizer()
+        if self.verbose:
+            if closed:
+                self._log("Closed Aardvark adapter")
+            else:
+                self._log("Released Aardvark adapter (%d user(s) remaining)", self._port.refcount)
     
     def __enter__(self):
         """Context manager entry"""
@@ -218,10 +574,40 @@ class AardvarkGPIO:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.close()
+
+
+def run_repl(gpio: AardvarkGPIO, stream):
+    """Execute GPIO commands read line by line from stream
     
-    def __del__(self):
-        """Destructor"""
-        self.close()
+    Commands:
+        H       set_high()
+        L       set_low()
+        G       print pin state
+        P <ms>  pulse(<ms>)
+    
+    Blank lines are ignored; unknown commands are reported on stderr and
+    skipped. The adapter stays open for the whole stream.
+    """
+    for line in stream:
+        cmd = line.strip().upper()
+        if not cmd:
+            continue
+        if cmd == 'H':
+            gpio.set_high()
+        elif cmd == 'L':
+            gpio.set_low()
+        elif cmd == 'G':
+            state = gpio.get_state()
+            print(f"GPIO {gpio.pin_name} is {'HIGH' if state else 'LOW'}", flush=True)
+        elif cmd.startswith('P '):
+            try:
+                duration_ms = int(cmd[2:])
+            except ValueError:
+                print(f"Error: invalid pulse duration: {line.strip()}", file=sys.stderr)
+                continue
+            gpio.pulse(duration_ms)
+        else:
+            print(f"Error: unknown command: {line.strip()}", file=sys.stderr)
 
 
 def main():
@@ -244,6 +630,13 @@ Examples:
   
   # Toggle cycle (high -> low -> high)
   python3 aardvark_gpio.py --port 0 --pin 0 --cycle --duration 2000
+  
+  # Toggle cycle without the initial settle delay
+  python3 aardvark_gpio.py --port 0 --pin 0 --cycle --duration 2000 --off-settle-ms 0
+  
+  # Keep the adapter open and read commands from stdin, one per line:
+  #   H = HIGH, L = LOW, G = get state, P <ms> = pulse
+  printf 'L\\nP 100\\nG\\n' | python3 aardvark_gpio.py --port 0 --pin 0 --repl -q
         """
     )
     
@@ -263,12 +656,19 @@ Examples:
                               help='Get GPIO state')
     action_group.add_argument('--cycle', action='store_true',
                               help='GPIO cycle (HIGH -> LOW -> HIGH)')
+    action_group.add_argument('--repl', action='store_true',
+                              help='Read commands (H, L, G, P <ms>) from stdin until EOF')
     
     parser.add_argument('--duration', type=int, default=2000,
                         help='Duration in ms for cycle command (default: 2000)')
+    parser.add_argument('--off-settle-ms', type=int, default=500,
+                        help='Settle time in ms after the first HIGH of a cycle, 0 to skip (default: 500)')
     
     args = parser.parse_args()
     
+    if args.off_settle_ms < 0:
+        parser.error("--off-settle-ms must be >= 0")
+    
     # Convert pin to int if it's a number
     try:
         pin = int(args.pin)
@@ -276,7 +676,10 @@ Examples:
         pin = args.pin
     
     try:
-        with AardvarkGPIO(port=args.port, pin=pin, verbose=not args.quiet) as gpio:
+        # The port is given explicitly, so let aa_open validate it instead of
+        # enumerating every attached adapter first
+        with AardvarkGPIO(port=args.port, pin=pin, verbose=not args.quiet,
+                          skip_enumeration=True) as gpio:
             if args.high:
                 gpio.set_high()
             elif args.low:
@@ -287,11 +690,14 @@ Examples:
             elif args.cycle:
                 print(f"GPIO cycling: HIGH -> LOW ({args.duration}ms) -> HIGH")
                 gpio.set_high()  # HIGH
-                time.sleep(0.5)
+                if args.off_settle_ms > 0:
+                    time.sleep(args.off_settle_ms / 1000.0)
                 gpio.set_low()   # LOW
                 time.sleep(args.duration / 1000.0)
                 gpio.set_high()  # HIGH
                 print("GPIO cycle complete")
+            elif args.repl:
+                run_repl(gpio, sys.stdin)
     
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)